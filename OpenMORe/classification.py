@@ -20,7 +20,6 @@ from . import clustering
 
 
 import numpy as np
-import numpy.matlib
 
 
 class VQPCA(clustering.lpca):
@@ -42,14 +41,10 @@ class VQPCA(clustering.lpca):
 
     def check_sanity_input(self):
         if self.X.shape[0] > len(self.idx) or self.X.shape[0] < len(self.idx):
-            raise Exception("The first dimension of the matrix X and the length of idx must agree.")
-            print("Exiting with error..")
-            exit()
+            raise ValueError("The first dimension of the matrix X and the length of idx must agree.")
 
         if self.X.shape[1] > self.Y.shape[1] or self.X.shape[1] < self.Y.shape[1]:
-            raise Exception("The second dimension of the matrix X and the second dimension of the matrix Y must agree.")
-            print("Exiting with error..")
-            exit()
+            raise ValueError("The second dimension of the matrix X and the second dimension of the matrix Y must agree.")
 
 
     def fit(self):
@@ -76,8 +71,8 @@ class VQPCA(clustering.lpca):
             cluster = get_cluster(self.X, self.idx, ii)
             centroids = get_centroids(cluster)
             modes = PCA_fit(cluster, self.nPCs)
-            C_mat = np.matlib.repmat(centroids, rows, 1)
-            rec_err_os = (Y_tilde - C_mat) - (Y_tilde - C_mat) @ modes[0] @ modes[0].T
+            Y_centered = Y_tilde - centroids
+            rec_err_os = Y_centered - Y_centered @ modes[0] @ modes[0].T
             sq_rec_oss = np.power(rec_err_os, 2)
             sq_rec_err[:,ii] = sq_rec_oss.sum(axis=1)
 
@@ -23,7 +23,6 @@ import time
 
 import numpy as np
 from numpy import linalg as LA
-import numpy.matlib
 import matplotlib
 import matplotlib.pyplot as plt
 
@@ -758,10 +757,11 @@ class lpca:
                 else:
                     local_model.set_PCs()
                 modes = local_model.fit()
-                #create the centroids (medoids or medianoids, respectively) matrix
-                C_mat = np.matlib.repmat(centroids, rows, 1)
+                #subtract the centroids (medoids or medianoids, respectively) once, and
+                #reuse the centered matrix for the rec error and the corrections
+                X_centered = self.X_tilde - centroids
                 #compute the rec error for the considered cluster
-                rec_err_os = (self.X_tilde - C_mat) - (self.X_tilde - C_mat) @ modes[0] @ modes[0].T
+                rec_err_os = X_centered - X_centered @ modes[0] @ modes[0].T
                 sq_rec_oss = np.power(rec_err_os, 2)
                 sq_rec_err[:,ii] = sq_rec_oss.sum(axis=1)
                 
@@ -798,8 +798,9 @@ class lpca:
                 
                 elif self._correction.lower() == "uncorrelation":
                     #the clusters where the observations maximize the uncorrelation are favoured
-                    maxF = np.max(np.var((self.X_tilde - C_mat) @ modes[0], axis=0))
-                    minF = np.min(np.var((self.X_tilde - C_mat) @ modes[0], axis=0))
+                    scores_var = np.var(X_centered @ modes[0], axis=0)
+                    maxF = np.max(scores_var)
+                    minF = np.min(scores_var)
                     yo = 1-minF/maxF
                     
                     scores_factor[:,ii] = sq_rec_err[:,ii] * yo
@@ -1243,9 +1244,8 @@ class KMeans(lpca):
             #The vector idx contains the corresponding class, while the minDist_
             #vector contains the numerical value of the distance, which will
             #be useful later, for the convergence check.
-            for ii in range(0, self.X.shape[0]):
-                idx[ii] = np.argmin(dist[ii,:])
-                minDist_[ii] = np.min(dist[ii,:])
+            idx = np.argmin(dist, axis=1)
+            minDist_ = dist[np.arange(self.X.shape[0]), idx]
             #Compute the new clusters and the sum of the distances.
             clusters = get_all_clusters(self.X, idx)
             C_old = C_mat
@@ -446,7 +446,8 @@ class PCA:
             axes.set_ylabel('Explained variance [-]')
             axes.set_title('Variance explained by {} PCs: {}'.format(self.eigens, round(explained,3)))
             axes.legend()
-        plt.show()
+            plt.show()
+            plt.close(fig)
 
         return explained
 
@@ -898,9 +899,7 @@ class LPCA(PCA):
 
     def check_sanity_input(self):
         if self.X.shape[0] > len(self.idx) or self.X.shape[0] < len(self.idx):
-            raise Exception("The first dimension of the matrix X and the length of idx must agree.")
-            print("Exiting with error..")
-            exit()
+            raise ValueError("The first dimension of the matrix X and the length of idx must agree.")
 
 
     def fit(self):
@@ -1225,8 +1224,7 @@ class KPCA(PCA):
             else:
                 Kernel = Kernel_approximation.RBFkernel(self.X_tilde, self.X_tilde, self._sigma, selfKernel="yes")
         else:
-            raise Exception("The selected Kernel is not supported. Exiting with error..")
-            exit()
+            raise ValueError("The selected Kernel is not supported. Exiting with error..")
 
         elapsed_kernel = time.time() - t   
         print("Kernel computed in {} s.".format(elapsed_kernel)) 
@@ -1523,11 +1521,9 @@ class variables_selection(PCA):
         if X.shape[1] != len(labels):
             print("Variables number: {}, Labels length: {}".format(X.shape[1], len(labels)))#.shape[1]))
             print(labels)
-            raise Exception("The number of variables does not match the labels.")
-            exit()
+            raise ValueError("The number of variables does not match the labels.")
         elif retained >= X.shape[1]:
-            raise Exception("The number of retained variables must be lower than the number of original variables.")
-            exit()
+            raise ValueError("The number of retained variables must be lower than the number of original variables.")
 
 
     def fit(self):
@@ -1835,8 +1831,7 @@ class variables_selection(PCA):
                         ret_name = sub_name_1
 
                 else:
-                    raise Exception("The selected McCabe criterion of choice is not available. Please choose an integer between 1 and 3.")
-                    exit()
+                    raise ValueError("The selected McCabe criterion of choice is not available. Please choose an integer between 1 and 3.")
 
                 
             ret_names = [int(x) for x in ret_name[0]]
@@ -1949,8 +1944,7 @@ class variables_selection(PCA):
                         ret_name = sub_name_1
 
                 else:
-                    raise Exception("The selected McCabe criterion of choice is not available. Please choose an integer between 1 and 3.")
-                    exit()
+                    raise ValueError("The selected McCabe criterion of choice is not available. Please choose an integer between 1 and 3.")
 
                 
             ret_names = [int(x) for x in ret_name[0]]
@@ -2283,8 +2277,7 @@ class Kernel_approximation:
                 self._numberToPick = settings["number_to_pick"]
 
                 if not isinstance(self._numberToPick, int):
-                    raise Exception(" ")
-                    exit()
+                    raise TypeError(" ")
                     
             except:
                 print("The number of columns to pick has not been given in input to the dictionary via the predefined entry: dictionary['number_to_pick']")
@@ -2294,8 +2287,7 @@ class Kernel_approximation:
                 self._sigma = settings["sigma"]
 
                 if not isinstance(self._sigma, int) and not isinstance(self._sigma, float):
-                    raise Exception(" ")
-                    exit()
+                    raise TypeError(" ")
             except:
                 print("The parameter sigma has not been given in input to the dictionary via the predefined entry: dictionary['sigma']")
                 print("\tIt will be automatically set equal to: 1.")
@@ -2304,8 +2296,7 @@ class Kernel_approximation:
                 self._rank = settings["rank"]
 
                 if not isinstance(self._rank, int):
-                    raise Exception(" ")
-                    exit()
+                    raise TypeError(" ")
 
             except:
                 print("The parameter rank has not been given in input to the dictionary via the predefined entry: dictionary['rank']")
@@ -2424,8 +2415,13 @@ class Kernel_approximation:
             kernel = np.exp(-xtot_norm_square/(2*sigma**2))
         else:
             from scipy.spatial.distance import pdist, squareform
-            pairwise_dists = squareform(pdist(x1, 'euclidean'))
-            kernel = np.exp(-pairwise_dists**2 / (2*sigma ** 2))
+            #the exponential is evaluated in-place on the condensed squared distances,
+            #the diagonal (zero distance) is then set to one
+            pairwise_dists = pdist(x1, 'sqeuclidean')
+            pairwise_dists *= -1/(2*sigma ** 2)
+            np.exp(pairwise_dists, out=pairwise_dists)
+            kernel = squareform(pairwise_dists)
+            np.fill_diagonal(kernel, 1)
 
         
         return kernel
@@ -2468,7 +2464,38 @@ class Kernel_approximation:
         return kernel
 
 
-    def Nystrom_computeWC(self):
+    @staticmethod
+    def solve_W(W, B):
+        #W is symmetric positive semi-definite. If it is numerically positive definite,
+        #W^(-1) B (= W^+ B) is computed via Cholesky factorization and triangular solves,
+        #which is cheaper than the SVD of the pseudoinverse. Otherwise (the factorization
+        #fails, or one of its pivots is below the tolerance), W^+ B is computed from the
+        #eigendecomposition of W, discarding the eigenvalues below the tolerance
+        from scipy.linalg import cho_factor, cho_solve, LinAlgError
+
+        n = W.shape[0]
+        tol = n*np.finfo(float).eps*np.max(np.abs(np.diag(W)))
+        try:
+            factor = cho_factor(W)
+            if np.min(np.diag(factor[0]))**2 <= tol:
+                raise LinAlgError("W is not numerically positive definite.")
+            W_pinv_B = cho_solve(factor, B)
+        except LinAlgError:
+            evals, evecs = LA.eigh(W)
+            tol = np.max(np.abs(evals))*n*np.finfo(float).eps
+            inv_evals = np.zeros_like(evals)
+            inv_evals[evals > tol] = 1/evals[evals > tol]
+            W_pinv_B = evecs @ (inv_evals[:, np.newaxis] * (evecs.T @ B))
+
+        return W_pinv_B
+
+
+    def Nystrom_computeWC(self, X=None):
+        #X is the (preprocessed) matrix used to build C and W; if it is not
+        #given, the input matrix is used as it is
+        if X is None:
+            X = self.X
+
         #indices that were picked uniform randomly
         #these are the indices that will be used to make the C and W matrix
         if self._numberToPick > self._number_of_rows:
@@ -2500,11 +2527,11 @@ class Kernel_approximation:
                 #could speed up more by using the symmetry of the matrices, but it is complicated to implement
                 #as the symmetric matrix W is not clearly at one place in the matrix C, but the elements of matrix W are spread in the whole matrix C
                 if self._kernelType.lower() == "rbf":
-                    kernel_calculated = self.RBFkernel(self.X[int(i)],self.X[int(m)], self._sigma) #calculate the kernel only once for the common elements of C and W
+                    kernel_calculated = self.RBFkernel(X[int(i)],X[int(m)], self._sigma) #calculate the kernel only once for the common elements of C and W
                 elif self._kernelType.lower() == "matern":
-                    kernel_calculated = self.Maternkernel(self.X[int(i)],self.X[int(m)], self._nu, self._rho, self._sigmaMatern) #calculate the kernel only once for the common elements of C and W
+                    kernel_calculated = self.Maternkernel(X[int(i)],X[int(m)], self._nu, self._rho, self._sigmaMatern) #calculate the kernel only once for the common elements of C and W
                 elif self._kernelType.lower() == "polynomial" or self._kernelType.lower() == "poly":
-                    kernel_calculated = self.PolynomialKernel(self.X[int(i)],self.X[int(m)], self._d, self._c) #calculate the kernel only once for the common elements of C and W
+                    kernel_calculated = self.PolynomialKernel(X[int(i)],X[int(m)], self._d, self._c) #calculate the kernel only once for the common elements of C and W
                 else:
                     print("The chosen Kernel is not available. Please check the spelling in your dictionary, or the available kernels in the documentation.")
                     print("exiting with error.")
@@ -2522,9 +2549,11 @@ class Kernel_approximation:
 
 
     def Nystrom_standard(self):
-        self.X = self.preprocess_training(self.X, self._center, self._scale, self._centering, self._scaling)
+        #preprocess in a separate matrix: overwriting self.X would center/scale
+        #again the already preprocessed data at each new call
+        X_tilde = self.preprocess_training(self.X, self._center, self._scale, self._centering, self._scaling)
 
-        W, C = self.Nystrom_computeWC()
+        W, C = self.Nystrom_computeWC(X_tilde)
 
         #eigenvalue decomposition of W
         W_eig_decomp = np.linalg.eig(W)
@@ -2591,12 +2620,9 @@ class Kernel_approximation:
 
             W, C = self.Nystrom_computeWC()
 
-            #calculate the pseudo inverse of W
-            W_pinv = np.linalg.pinv(W)
-            
-            #K_approximation = C*W_pinv*C_transpose
-            Temporary_result = np.matmul(C,W_pinv)
-            K_approximation = np.matmul(Temporary_result,np.transpose(C))
+            #K_approximation = C*W_pinv*C_transpose, with W_pinv*C_transpose computed
+            #without forming the pseudo inverse of W
+            K_approximation = np.matmul(C,self.solve_W(W, np.transpose(C)))
             
             #K_ensemble = sum(1/p*K_approximated) with 1/p the weigth of each kernelmatrix
             #in this case it is a uniform weigth
@@ -2611,14 +2637,12 @@ class Kernel_approximation:
     def QRdecomposition(self):
         W, C = self.Nystrom_computeWC()
 
-        #calculate the pseudoinverse of W    
-        W_pinv = np.linalg.pinv(W)
-
         #calculate the QR decomposition of C
         Q, R= np.linalg.qr(C)
 
-        #eigenvalue decomposition of the matrix R*W_pseudoinverse*R_transpose
-        eig_decomp = np.linalg.eig(np.matmul(R,np.matmul(W_pinv,np.transpose(R))))
+        #eigenvalue decomposition of the matrix R*W_pseudoinverse*R_transpose, where
+        #W_pseudoinverse*R_transpose is computed without forming the pseudoinverse of W
+        eig_decomp = np.linalg.eig(np.matmul(R,self.solve_W(W, np.transpose(R))))
         sigma = eig_decomp[0]  #eigenvalues
         V = eig_decomp[1]  #eigenvectors
         
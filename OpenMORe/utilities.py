@@ -127,7 +127,8 @@ def explained_variance(X, n_eigs, plot=False):
         axes.set_ylabel('Explained variance [-]')
         axes.set_title('Variance explained by {} PCs: {}'.format(n_eigs, round(explained,3)))
         axes.legend()
-    plt.show()
+        plt.show()
+        plt.close(fig)
 
     return explained
 
@@ -377,13 +378,14 @@ def get_all_clusters(X, idx):
     - Output:
     clusters: list with the clusters from 0 to k -- dim: (k)
     '''
-    k = max(idx) +1
-    clusters = [None] *k
+    idx = np.asarray(idx).ravel().astype(int)
+    k = int(np.max(idx)) +1
 
-    for ii in range (0,k):
-        #identify the observations which belong to a certain cluster
-        #and store them in the clusters' list
-        clusters[ii] = get_cluster(X, idx, ii)
+    #sort the observations by membership once (stable, to keep their original
+    #order within each cluster) and split them, instead of a search for each cluster
+    order = np.argsort(idx, kind='stable')
+    bounds = np.cumsum(np.bincount(idx, minlength=k))[:-1]
+    clusters = np.split(X[order], bounds)
 
     return clusters
 
@@ -509,13 +511,15 @@ def scale(X, method, return_scaled_matrix=False):
         return sig, X0
 
 
-def split_for_validation(X, validation_quota):
+def split_for_validation(X, validation_quota, seed=None):
     '''
     Split the data into two matrices, one to train the model (X_train) and the
-    other to validate it.
+    other to validate it. The input matrix is not modified.
     - Input:
     X = matrix to be split -- dim: (observations x variables)
     validation_quota = percentage of observations to take as validation
+    seed = seed for the random split, optional: the same seed always gives the same split,
+    thus it can be used to reuse a split across several trainings -- dim: (scalar)
     - Output:
     X_train = matrix to be used to train the reduced model
     X_test = matrix to be used to test the reduced model
@@ -528,12 +532,16 @@ def split_for_validation(X, validation_quota):
     #compute how many observations must be included in the test
     nTest = int(nObs * validation_quota)
 
-    #shuffle the training matrix to maximize the randomness of the subset
-    np.random.shuffle(X)
+    #shuffle the indices of the observations (and not the matrix itself, which
+    #would be modified in place) to maximize the randomness of the subset
+    if seed is None:
+        positions = np.random.permutation(nObs)
+    else:
+        positions = np.random.RandomState(seed).permutation(nObs)
 
-    #split
-    X_test = X[:nTest,:]
-    X_train = X[nTest+1:,:]
+    #split: each observation is gathered only once, in one of the two matrices
+    X_test = X[positions[:nTest],:]
+    X_train = X[positions[nTest:],:]
 
     return X_train, X_test
 
@@ -555,8 +563,7 @@ def uncenter(X_tilde, mu):
             X0[:,i] = X_tilde[:,i] + mu[i]
         return X0
     else:
-        raise Exception("The matrix to be uncentered and the centering vector must have the same dimensionality.")
-        exit()
+        raise ValueError("The matrix to be uncentered and the centering vector must have the same dimensionality.")
 
 
 def unscale(X_tilde, sigma):
@@ -577,8 +584,7 @@ def unscale(X_tilde, sigma):
             X0[:,i] = X_tilde[:,i] * (sigma[i] + TOL)
         return X0
     else:
-        raise Exception("The matrix to be unscaled and the scaling vector must have the same dimensionality.")
-        exit()
+        raise ValueError("The matrix to be unscaled and the scaling vector must have the same dimensionality.")
 
 
 def varimax_rotation(X, b):
@@ -0,0 +1,71 @@
+import numpy as np
+import os
+from scipy.spatial.distance import cdist
+
+import OpenMORe.model_order_reduction as model_order_reduction
+from OpenMORe.utilities import *
+
+############################################################################
+# In this example it's shown how to approximate the RBF Kernel matrix of an
+# input matrix X via the Nyström algorithm (QR decomposition variant), and
+# how to measure the error with respect to the exact Kernel.
+############################################################################
+
+# Dictionary to load the input matrix, found in .csv format
+file_options = {
+    "path_to_file"              : os.path.abspath(os.path.join(__file__ ,"../../../data/reactive_flow/")),
+    "input_file_name"           : "turbo2D.csv",
+}
+
+# Dictionary with the instructions for the Kernel approximation class.
+# The data will be centered and scaled outside the class, thus they don't
+# have to be processed and the options are set to False.
+settings = {
+    #centering and scaling options
+    "center"                    : False,
+    "centering_method"          : "mean",
+    "scale"                     : False,
+    "scaling_method"            : "auto",
+
+    #set the kernel type and its parameters
+    "kernel_type"               : "rbf",
+    "sigma"                     : 1,
+    "polynomial_degree"         : 2,
+    "polynomial_freeParameter"  : 1,
+    "nu_matern"                 : 1,
+    "rho_matern"                : 1,
+    "sigma_matern"              : 1,
+
+    #set the number of columns to sample and the rank of the approximation
+    "number_to_pick"            : 100,
+    "rank"                      : 50,
+    "number_of_matrices"        : 1,
+}
+
+# Load the input matrix, take a subset of the observations and center/scale it
+X = readCSV(file_options["path_to_file"], file_options["input_file_name"])
+X = X[:2000,:]
+X_tilde = center_scale(X, center(X,"mean"), scale(X,"auto"))
+
+# Approximate the Kernel matrix via Nyström with QR decomposition
+model = model_order_reduction.Kernel_approximation(X_tilde, settings)
+Kapprox = model.QRdecomposition().real.astype(np.float32)
+
+# Compute the relative error (Frobenius norm) with respect to the exact Kernel,
+# K_ij = exp(-||x_i - x_j||^2 / (2 sigma^2)). The exact Kernel is built in
+# blocks of rows (distances and exponential in double precision), so it is
+# never stored as a whole.
+gamma = 1/(2*settings["sigma"]**2)
+num = 0.0
+den = 0.0
+for start in range(0, X_tilde.shape[0], 500):
+    K_block = cdist(X_tilde[start:start+500,:], X_tilde, 'sqeuclidean')
+    K_block *= -gamma
+    np.exp(K_block, out=K_block)
+    K_block = K_block.astype(np.float32)
+
+    den += np.einsum('ij,ij->', K_block, K_block, dtype=np.float64)
+    np.subtract(Kapprox[start:start+500,:], K_block, out=K_block)
+    num += np.einsum('ij,ij->', K_block, K_block, dtype=np.float64)
+
+print("Relative error (Frobenius norm) of the Kernel approximation: {}".format(np.sqrt(num/den)))
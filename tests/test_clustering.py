@@ -76,3 +76,16 @@ class testClustering(unittest.TestCase):
             passed = False 
         
         self.assertEqual(passed, True)
+
+    def test_getAllClusters(self):
+        #float membership vector, with an empty cluster (1) in the middle
+        idx = np.array([0, 2, 3, 0, 2, 2, 0, 3, 3, 0], dtype=float)
+        X = np.random.rand(idx.shape[0], 5)
+
+        clusters = get_all_clusters(X, idx)
+        expected = [get_cluster(X, idx, ii) for ii in range(4)]
+
+        self.assertEqual(len(clusters), len(expected))
+        self.assertEqual(clusters[1].shape[0], 0)
+        for cluster, cluster_expected in zip(clusters, expected):
+            np.testing.assert_array_equal(cluster, cluster_expected)
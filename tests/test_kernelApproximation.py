@@ -0,0 +1,52 @@
+'''
+MODULE: test_kernelApproximation.py
+
+@Authors:
+    G. D'Alessio [1,2]
+    [1]: Université Libre de Bruxelles, Aero-Thermo-Mechanics Laboratory, Bruxelles, Belgium
+    [2]: CRECK Modeling Lab, Department of Chemistry, Materials and Chemical Engineering, Politecnico di Milano
+
+@Contacts:
+    giuseppe.dalessio@ulb.ac.be
+
+
+@Additional notes:
+    This code is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+    Please report any bug to: giuseppe.dalessio@ulb.ac.be
+'''
+
+import unittest
+
+import numpy as np
+from numpy import linalg as LA
+
+import OpenMORe.model_order_reduction as model_order_reduction
+from OpenMORe.utilities import *
+
+
+class testKernelApproximation(unittest.TestCase):
+
+    def setUp(self):
+        self.X = np.random.rand(20,3)
+        self.B = np.random.rand(20,5)
+
+    def tearDown(self):
+        pass
+
+    def test_solveW_rbf(self):
+        #RBF W, shifted by the identity to be well-conditioned: the Cholesky path is used
+        W = model_order_reduction.Kernel_approximation.RBFkernel(self.X, self.X, 1, selfKernel="yes")
+        W += np.eye(W.shape[0])
+
+        W_pinv_B = model_order_reduction.Kernel_approximation.solve_W(W, self.B)
+
+        np.testing.assert_allclose(W_pinv_B, LA.pinv(W) @ self.B, rtol=1E-8, atol=1E-10)
+
+    def test_solveW_polynomial(self):
+        #polynomial W with degree 2 in 3 dimensions: its rank (10) is lower than the
+        #number of sampled points, thus the eigendecomposition fallback is used
+        W = (self.X @ self.X.T + 1)**2
+
+        W_pinv_B = model_order_reduction.Kernel_approximation.solve_W(W, self.B)
+
+        np.testing.assert_allclose(W_pinv_B, LA.pinv(W, hermitian=True) @ self.B, rtol=1E-6, atol=1E-8)
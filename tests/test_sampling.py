@@ -54,4 +54,22 @@ class testSampling(unittest.TestCase):
 
         miniX = sample.fit()
 
-        self.assertEqual(miniX.shape[0], self.dimensions)
\ No newline at end of file
+        self.assertEqual(miniX.shape[0], self.dimensions)
+
+    def test_splitForValidation(self):
+        X = np.arange(self.X.shape[0]*2, dtype=float).reshape(-1,2)
+        X_copy = X.copy()
+
+        X_train, X_test = split_for_validation(X, 0.3, seed=0)
+
+        #the input matrix is not modified
+        np.testing.assert_array_equal(X, X_copy)
+        #the two matrices are a partition of the observations
+        self.assertEqual(X_test.shape[0], int(X.shape[0]*0.3))
+        self.assertEqual(X_train.shape[0] + X_test.shape[0], X.shape[0])
+        rows = np.sort(np.concatenate((X_train[:,0], X_test[:,0])))
+        np.testing.assert_array_equal(rows, X[:,0])
+        #the same seed gives the same split
+        X_train2, X_test2 = split_for_validation(X, 0.3, seed=0)
+        np.testing.assert_array_equal(X_test, X_test2)
+        np.testing.assert_array_equal(X_train, X_train2)